@@ -5,6 +5,7 @@ The main module of the application containing the entry point.
 """
 
 import argparse
+import concurrent.futures
 import importlib
 import logging
 import time
@@ -111,7 +112,14 @@ def _get_initial_configuration(input_conf: Dict[str, Any],
 
     return Configuration(name, timestamp, docker_repository, kerberos, resource_path)
 
+def _get_ready_components(remaining: List[str],
+                          dependencies: Dict[str, List[str]],
+                          built_configuration: Configuration) -> List[str]:
+    return [component for component in remaining
+            if all(dependency in built_configuration.components for dependency in dependencies[component])]
+
 def _build_component_images(components: List[str],
+                            dependencies: Dict[str, List[str]],
                             input_configuration: Dict[str, Dict[str, str]],
                             initial_configuration: Configuration,
                             image_builders: Dict[str, ComponentImageBuilder],
@@ -120,20 +128,40 @@ def _build_component_images(components: List[str],
 
     logging.info("Building components in the following order: %s.", components)
 
-    for component in components:
-        component_conf = input_configuration[component]
-        image_builder = image_builders[component]
-        force_rebuild_component = component in force_rebuild
-
-        try:
-            component_config = image_builder.build(component_conf, resulting_configuration, force_rebuild_component)
-        # pylint: disable=broad-except
-        except Exception as exception:
-
-            return (resulting_configuration, exception)
-
-        # pylint: enable=broad-except
-        resulting_configuration.components[component] = component_config
+    # Building a component is mostly waiting for network and docker i/o, so components whose
+    # dependencies are already built are submitted to a thread pool and built concurrently.
+    # The results of a batch are recorded before the next batch is chosen, therefore each
+    # component only runs when the configuration of all of its dependencies is available.
+    remaining = list(components)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(components))) as executor:
+        while len(remaining) > 0:
+            ready = _get_ready_components(remaining, dependencies, resulting_configuration)
+
+            futures = {component: executor.submit(image_builders[component].build,
+                                                  input_configuration[component],
+                                                  resulting_configuration,
+                                                  component in force_rebuild)
+                       for component in ready}
+
+            # All results of the batch are collected before handling any failure: the
+            # successfully built components must be recorded in the configuration so
+            # that the generated output report shows every image that was created.
+            first_exception: Optional[Exception] = None
+            for component in ready:
+                try:
+                    component_config = futures[component].result()
+                # pylint: disable=broad-except
+                except Exception as exception:
+                    if first_exception is None:
+                        first_exception = exception
+                    continue
+
+                # pylint: enable=broad-except
+                resulting_configuration.components[component] = component_config
+                remaining.remove(component)
+
+            if first_exception is not None:
+                return (resulting_configuration, first_exception)
 
     return (resulting_configuration, None)
 
@@ -215,6 +243,7 @@ def start_dbd(args: argparse.Namespace) -> None:
 
     force_rebuild_components = _get_force_rebuild_components(args, components)
     (output_configuration, exception) = _build_component_images(topologically_sorted_components,
+                                                                dependencies,
                                                                 input_conf["components"],
                                                                 initial_configuration,
                                                                 image_builders,
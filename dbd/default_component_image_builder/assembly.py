@@ -5,7 +5,7 @@ This module contains a class that stores constant component-specific
 information that does not depend on the actual build configuration.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 class Assembly:
     """
@@ -74,3 +74,28 @@ class Assembly:
         self.version_command = version_command
         self.version_regex = version_regex
         self.others: Dict[str, Any] = others if others is not None else {}
+
+        # The bound `format` method is looked up once here instead of on every url generation.
+        self._url_formatter: Optional[Callable[..., str]] = (url_template.format
+                                                             if url_template is not None
+                                                             else None)
+
+    def get_url(self, version: str) -> str:
+        """
+        Returns the url from which the release archive of the given version can be downloaded.
+
+        Args:
+            version: The version number of the component.
+
+        Returns:
+            The url of the release archive.
+
+        Raises:
+            ValueError: If the assembly does not contain a url template.
+
+        """
+
+        if self._url_formatter is None:
+            raise ValueError("The `url` key is missing from the assembly but needed to download the component.")
+
+        return self._url_formatter(version=version)
@@ -13,11 +13,12 @@ from pathlib import Path
 
 import re
 
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
 import docker
 
 from dbd.configuration import Configuration
+import dbd.docker_setup
 from dbd.component_builder import ComponentImageBuilder
 from dbd.component_config import ComponentConfig, DistType, DistInfo
 from dbd.default_component_image_builder.assembly import Assembly
@@ -69,12 +70,15 @@ class DefaultComponentImageBuilder(ComponentImageBuilder):
 
         self._name = component_name
         self._assembly = assembly
+
+        # The sorted dependencies are needed for every image name computation - caching
+        # them as a tuple also avoids mutating the assembly's dependency list by sorting.
+        self._sorted_dependencies: Tuple[str, ...] = tuple(sorted(assembly.dependencies))
+
         self._cache = cache
         self._pipeline_builder = pipeline_builder
         self._pipeline_executor = pipeline_executor
 
-        self._docker_client = docker.from_env()
-
     def name(self) -> str:
         return self._name
 
@@ -123,24 +127,12 @@ class DefaultComponentImageBuilder(ComponentImageBuilder):
     def _get_image_name(self,
                         id_string: str,
                         built_config: Configuration) -> str:
-        template = "{repository}/{component}:{component_tag}{dependencies_tag}{kerberos_tag}"
-
-        dependencies = self.dependencies()
-        dependencies.sort()
-
-        deps_join_list: List[str] = [""]
-        for dependency in dependencies:
-            dependency_tag = built_config.components[dependency].image_name.split(":")[-1]
-            deps_join_list.append(dependency + dependency_tag)
-
-        dependencies_tag = "_".join(deps_join_list)
+        dependencies_tag = "".join(
+            "_{}{}".format(dependency, built_config.components[dependency].image_name.split(":")[-1])
+            for dependency in self._sorted_dependencies)
         kerberos_tag = "_kerberos" if built_config.kerberos else ""
 
-        return template.format(repository=built_config.repository,
-                               component=self.name(),
-                               component_tag=id_string,
-                               dependencies_tag=dependencies_tag,
-                               kerberos_tag=kerberos_tag)
+        return f"{built_config.repository}/{self.name()}:{id_string}{dependencies_tag}{kerberos_tag}"
 
     def _get_version(self, dist_type: DistType, argument: str, image_name: str) -> str:
         if dist_type == DistType.RELEASE:
@@ -154,7 +146,7 @@ class DefaultComponentImageBuilder(ComponentImageBuilder):
             raise ValueError(
                 "The `version_regex` key is missing from the assembly but needed to find out the version number.")
 
-        version = _find_out_version_from_image(self._docker_client,
+        version = _find_out_version_from_image(dbd.docker_setup.get_docker_client(),
                                                image_name,
                                                self.name(),
                                                self._assembly.version_command,
@@ -244,24 +236,37 @@ def _find_out_version_from_image(docker_client: docker.DockerClient,
     version = match.group(1)
     return version
 
+def _get_release_id_string(argument: str) -> str:
+    # The id_string is the version string.
+    version = argument
+    return version
+
+def _get_snapshot_id_string(argument: str) -> str:
+    # The id_string is the hash of the source path prepended to the last modification of the source path tree.
+    source_path = Path(argument).expanduser().resolve()
+    source_path_hash = hashlib.sha1(str(source_path).encode()).hexdigest()
+    last_mod = _get_last_modification_in_directory_tree(source_path)
+    return "{}_{}".format(source_path_hash, str(int(last_mod)))
+
+# Maps each distribution type to the function computing the id_string for it, the same
+# way the `Cache` class maps distribution types to cache directory names.
+_ID_STRING_FUNCTIONS: Dict[DistType, Callable[[str], str]] = {DistType.RELEASE: _get_release_id_string,
+                                                              DistType.SNAPSHOT: _get_snapshot_id_string}
+
 def _get_id_string(dist_info: DistInfo) -> str:
-    # pylint: disable=no-else-return
-    if dist_info.dist_type == DistType.RELEASE:
-        # The id_string is the version string.
-        version = dist_info.argument
-        return version
-    else:
-        # The id_string is the hash of the source path prepended to the last modification of the source path tree.
-        source_path = Path(dist_info.argument).expanduser().resolve()
-        source_path_hash = hashlib.sha1(str(source_path).encode()).hexdigest()
-        last_mod = _get_last_modification_in_directory_tree(source_path)
-        return "{}_{}".format(source_path_hash, str(int(last_mod)))
+    try:
+        id_string_function = _ID_STRING_FUNCTIONS[dist_info.dist_type]
+    except KeyError:
+        raise ValueError("Unexpected distribution type: {}.".format(dist_info.dist_type))
+
+    return id_string_function(dist_info.argument)
 
 def _get_last_modification_in_directory_tree(directory: Path) -> float:
     return max(map(lambda path: path.stat().st_mtime, _generate_all_paths(directory)))
 
 def _generate_all_paths(directory: Path) -> Iterable[Path]:
-    dir_path = Path(directory.expanduser().resolve())
+    # The directory path is already expanded and resolved by the caller.
+    dir_path = directory
     if not dir_path.is_dir():
         yield dir_path
     else:
@@ -4,8 +4,9 @@
 This module contains a class which can be used to query cache locations that depend on the component and configuration.
 """
 import logging
+import os
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 from dbd.component_config import DistType
@@ -37,6 +38,17 @@ class Cache:
 
         self._dist_type_paths = {DistType.RELEASE: "release", DistType.SNAPSHOT: "snapshot"}
 
+        # Maps component names to their archive file names - `get_path` is called for every
+        # stage of every build, so the file name is only formatted once per component.
+        self._archive_file_names: Dict[str, str] = {}
+
+    def get_base_path(self) -> Path:
+        """
+        Returns the path to the root cache directory.
+        """
+
+        return self._base_path
+
     def get_path(self,
                  component_name: str,
                  stage_name: str,
@@ -53,12 +65,17 @@ class Cache:
                 release builds, it could be the version number.
         """
 
+        archive_file_name = self._archive_file_names.get(component_name)
+        if archive_file_name is None:
+            archive_file_name = "{}.tar.gz".format(component_name)
+            self._archive_file_names[component_name] = archive_file_name
+
         return (self._base_path
                 / component_name
                 / self._stage_name_paths.get(stage_name, stage_name) # The second argument is the default return value.
                 / self._dist_type_paths[dist_type]
                 / id_string
-                / "{}.tar.gz".format(component_name))
+                / archive_file_name)
 
     def enforce_max_size(self) -> List[Path]:
         """
@@ -70,11 +87,12 @@ class Cache:
 
         """
 
-        all_files = self._base_path.glob("**/*")
-        regular_files = list(filter(Path.is_file, all_files))
-        regular_files.sort(key=lambda path: path.stat().st_atime, reverse=True)
+        regular_files_with_atime: List[Tuple[float, Path]] = []
+        Cache._collect_regular_files(self._base_path, regular_files_with_atime)
+
+        regular_files_with_atime.sort(key=lambda pair: pair[0], reverse=True)
 
-        to_delete = regular_files[self._max_size : ]
+        to_delete = [path for (_, path) in regular_files_with_atime[self._max_size : ]]
 
         logging.info("Deleting cache files: %s.", to_delete)
         for file_path in to_delete:
@@ -86,10 +104,32 @@ class Cache:
 
         return to_delete
 
+    @staticmethod
+    def _collect_regular_files(directory: Path, result: List[Tuple[float, Path]]) -> None:
+        # A single scandir pass per directory provides the file type of each entry for free,
+        # so only the regular files - whose access time is needed for sorting - are stat-ed.
+        try:
+            entries = list(os.scandir(directory))
+        except FileNotFoundError:
+            return
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                Cache._collect_regular_files(Path(entry.path), result)
+            elif entry.is_file(follow_symlinks=False):
+                result.append((entry.stat().st_atime, Path(entry.path)))
+
     @staticmethod
     def _recursively_delete_empty_dirs(path: Path) -> None:
-        for child in path.iterdir():
-            if child.is_dir():
-                Cache._recursively_delete_empty_dirs(child)
-        if len(list(path.iterdir())) == 0:
-            path.rmdir()
+        with os.scandir(path) as entries:
+            children = list(entries)
+
+        for child in children:
+            if child.is_dir(follow_symlinks=False):
+                Cache._recursively_delete_empty_dirs(Path(child.path))
+
+        # Deleting empty children may have emptied this directory, so it is checked again -
+        # but only until the first remaining entry, without listing the whole directory.
+        with os.scandir(path) as entries:
+            if next(iter(entries), None) is None:
+                path.rmdir()
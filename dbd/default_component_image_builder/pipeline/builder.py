@@ -7,11 +7,12 @@ This module contains the `PipelineBuilder` interface and a default implementatio
 from abc import ABCMeta, abstractmethod
 from pathlib import Path
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict
 
 import docker
 
 from dbd.configuration import Configuration
+import dbd.docker_setup
 from dbd.component_config import ComponentConfig, DistInfo, DistType
 from dbd.default_component_image_builder.assembly import Assembly
 from dbd.default_component_image_builder.pipeline import EntryStage, Pipeline
@@ -67,12 +68,12 @@ class DefaultPipelineBuilder(PipelineBuilder):
                        image_name: str,
                        dist_info: DistInfo,
                        docker_context_dir: Path) -> Pipeline:
-        entry_stage = DefaultPipelineBuilder._get_entry_stage(dist_info, assembly.url_template)
+        entry_stage = DefaultPipelineBuilder._get_entry_stage(dist_info, assembly)
 
         dependencies = {dependency : built_config.components[dependency]
                         for dependency in assembly.dependencies}
 
-        docker_image_stage = DefaultPipelineBuilder.get_docker_image_stage(docker.from_env(),
+        docker_image_stage = DefaultPipelineBuilder.get_docker_image_stage(dbd.docker_setup.get_docker_client(),
                                                                            image_name,
                                                                            dependencies,
                                                                            docker_context_dir,
@@ -113,19 +114,17 @@ class DefaultPipelineBuilder(PipelineBuilder):
                                      build_args)
 
     @staticmethod
-    def _get_entry_stage(dist_info: DistInfo, url_template: Optional[str]) -> EntryStage:
+    def _get_entry_stage(dist_info: DistInfo, assembly: Assembly) -> EntryStage:
         # pylint: disable=no-else-return
         if dist_info.dist_type == DistType.RELEASE:
             downloader = DefaultDownloader()
             version = dist_info.argument
 
-            if url_template is None:
-                raise ValueError("The `url` key is missing from the assembly but needed to download the component.")
-
-            url = url_template.format(version=version)
+            url = assembly.get_url(version)
             return DownloadFileStage("archive", downloader, url)
         else:
             assert dist_info.dist_type == DistType.SNAPSHOT
 
-            source_dir = Path(dist_info.argument).expanduser().resolve()
+            # The path is expanded and resolved by the CreateTarfileStage constructor.
+            source_dir = Path(dist_info.argument)
             return CreateTarfileStage("archive", source_dir)
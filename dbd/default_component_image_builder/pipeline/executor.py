@@ -84,19 +84,25 @@ class DefaultPipelineExecutor(PipelineExecutor):
                     id_string: str,
                     cache: Cache,
                     pipeline: Pipeline) -> None:
-        entry_stage = pipeline.entry_stage
-        entry_output_path = cache.get_path(component_name, entry_stage.name(), dist_type, id_string)
+        with DefaultPipelineExecutor._scratch_dir(cache) as tmp_dir_name:
+            tmp_dir = Path(tmp_dir_name)
+
+            entry_stage = pipeline.entry_stage
+            entry_output_path = cache.get_path(component_name, entry_stage.name(), dist_type, id_string)
 
-        DefaultPipelineExecutor._execute_output_stage_with_atomic_cache_entry(entry_stage, entry_output_path)
+            DefaultPipelineExecutor._execute_output_stage_with_atomic_cache_entry(entry_stage,
+                                                                                  entry_output_path,
+                                                                                  tmp_dir)
 
-        inner_stages_input_path = entry_output_path
-        DefaultPipelineExecutor._execute_from(component_name,
-                                              dist_type,
-                                              id_string,
-                                              cache,
-                                              pipeline,
-                                              inner_stages_input_path,
-                                              0)
+            inner_stages_input_path = entry_output_path
+            DefaultPipelineExecutor._execute_from(component_name,
+                                                  dist_type,
+                                                  id_string,
+                                                  cache,
+                                                  pipeline,
+                                                  inner_stages_input_path,
+                                                  0,
+                                                  tmp_dir)
 
     def execute_needed(self,
                        component_name: str,
@@ -118,13 +124,15 @@ class DefaultPipelineExecutor(PipelineExecutor):
             self.execute_all(component_name, dist_type, id_string, cache, pipeline)
         else:
             index, input_path = first_needed_stage_index_and_input_path
-            DefaultPipelineExecutor._execute_from(component_name,
-                                                  dist_type,
-                                                  id_string,
-                                                  cache,
-                                                  pipeline,
-                                                  input_path,
-                                                  index)
+            with DefaultPipelineExecutor._scratch_dir(cache) as tmp_dir_name:
+                DefaultPipelineExecutor._execute_from(component_name,
+                                                      dist_type,
+                                                      id_string,
+                                                      cache,
+                                                      pipeline,
+                                                      input_path,
+                                                      index,
+                                                      Path(tmp_dir_name))
 
     @staticmethod
     def _get_first_needed_stage_index_and_input_path(component_name: str,
@@ -143,6 +151,17 @@ class DefaultPipelineExecutor(PipelineExecutor):
 
         return None
 
+    @staticmethod
+    def _scratch_dir(cache: Cache) -> tempfile.TemporaryDirectory:
+        # The scratch directory is created inside the cache, so moving a finished stage output
+        # to its cache location is an atomic rename on the same filesystem - a scratch directory
+        # in the system-wide temporary directory would make the move a full copy of the file
+        # whenever the cache lives on a different filesystem.
+        base_path = cache.get_base_path()
+        base_path.mkdir(parents=True, exist_ok=True)
+
+        return tempfile.TemporaryDirectory(dir=str(base_path))
+
     @staticmethod
     def _execute_from(component_name: str,
                       dist_type: DistType,
@@ -150,13 +169,15 @@ class DefaultPipelineExecutor(PipelineExecutor):
                       cache: Cache,
                       pipeline: Pipeline,
                       input_path: Path,
-                      start_index: int) -> None:
+                      start_index: int,
+                      tmp_dir: Path) -> None:
         for stage in pipeline.inner_stages[start_index:]:
             output_path = cache.get_path(component_name, stage.name(), dist_type, id_string)
 
             DefaultPipelineExecutor._execute_output_stage_with_atomic_cache_entry(
                 DefaultPipelineExecutor._OutputExecutableWrapper(stage, input_path),
-                output_path)
+                output_path,
+                tmp_dir)
 
             input_path = output_path
 
@@ -165,12 +186,13 @@ class DefaultPipelineExecutor(PipelineExecutor):
 
     @staticmethod
     def _execute_output_stage_with_atomic_cache_entry(stage: Union[EntryStage, _OutputExecutableWrapper],
-                                                      output_path: Path) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir_name:
-            tmp_dir = Path(tmp_dir_name)
-            tmp_file_path = tmp_dir / "temp_file"
+                                                      output_path: Path,
+                                                      tmp_dir: Path) -> None:
+        # The scratch directory is shared by all stages of a pipeline run; the temporary file
+        # can be reused because moving it into the cache removes it from the scratch directory.
+        tmp_file_path = tmp_dir / "temp_file"
 
-            stage.execute(tmp_file_path)
+        stage.execute(tmp_file_path)
 
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.move(tmp_file_path, output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(tmp_file_path, output_path)
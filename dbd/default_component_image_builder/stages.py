@@ -6,20 +6,29 @@ This module contains pipeline stages needed by the `DefaultComponentImageBuilder
 
 from abc import ABCMeta, abstractmethod
 import logging
+import os
 from pathlib import Path
 
 import shutil
+import subprocess
 import tarfile
 import tempfile
-import urllib.request
+import threading
 
-from typing import Dict, Iterable
+from typing import BinaryIO, Dict, Optional
 
 import docker
+import requests
 
 import dbd.defaults
 from dbd.default_component_image_builder.pipeline import EntryStage, FinalStage
 
+# A multiple of `tarfile.RECORDSIZE`, so that reads and writes stay aligned to tar records.
+_TARFILE_BUFSIZE: int = 64 * tarfile.RECORDSIZE
+
+# Docker build contexts up to this size are assembled in memory; larger ones spill to disk.
+_BUILD_CONTEXT_SPOOL_MAX_SIZE: int = 64 * 1024 * 1024
+
 class CreateTarfileStage(EntryStage):
     """
     An entry stage that creates a tar archive of a directory.
@@ -47,8 +56,62 @@ class CreateTarfileStage(EntryStage):
                      self.name(),
                      self._src_dir)
 
-        with tarfile.open(output_path, "w:gz") as tar:
-            tar.add(str(self._src_dir), arcname=self._src_dir.name)
+        with output_path.open(mode="wb", buffering=_TARFILE_BUFSIZE) as outfile:
+            pigz_path = shutil.which("pigz")
+
+            if pigz_path is not None:
+                CreateTarfileStage._create_archive_with_pigz(pigz_path, self._src_dir, outfile)
+            else:
+                with tarfile.open(fileobj=outfile, mode="w:gz", bufsize=_TARFILE_BUFSIZE) as tar:
+                    CreateTarfileStage._add_tree(tar, self._src_dir, self._src_dir.name)
+
+    @staticmethod
+    def _create_archive_with_pigz(pigz_path: str, src_dir: Path, outfile: BinaryIO) -> None:
+        # pigz compresses on all available cores in a separate process, so the Python
+        # thread only has to produce the uncompressed tar stream instead of also running
+        # the CPU-bound gzip compression through the gzip module.
+        process = subprocess.Popen([pigz_path, "-c"], stdin=subprocess.PIPE, stdout=outfile)
+
+        assert process.stdin is not None
+
+        try:
+            with tarfile.open(fileobj=process.stdin, mode="w|", bufsize=_TARFILE_BUFSIZE) as tar:
+                CreateTarfileStage._add_tree(tar, src_dir, src_dir.name)
+        finally:
+            process.stdin.close()
+            return_code = process.wait()
+
+        if return_code != 0:
+            raise ValueError("Compressing the archive with pigz failed with return code {}.".format(return_code))
+
+    @staticmethod
+    def _add_tree(tar: tarfile.TarFile, path: Path, arcname: str) -> None:
+        # `TarFile.add` lists each directory with os.listdir and stats every name separately;
+        # os.scandir yields the entries of the same directory pass along with their file types.
+        tar_info = CreateTarfileStage._normalise_owner(tar.gettarinfo(str(path), arcname))
+
+        if tar_info.isreg():
+            with path.open(mode="rb") as file:
+                tar.addfile(tar_info, file)
+        elif tar_info.isdir():
+            tar.addfile(tar_info)
+
+            with os.scandir(path) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    CreateTarfileStage._add_tree(tar, Path(entry.path), "{}/{}".format(arcname, entry.name))
+        else:
+            tar.addfile(tar_info)
+
+    @staticmethod
+    def _normalise_owner(tar_info: tarfile.TarInfo) -> tarfile.TarInfo:
+        # Clearing the owner information makes the archive independent of the local
+        # user, so identical source trees always produce identical archive contents.
+        tar_info.uid = 0
+        tar_info.gid = 0
+        tar_info.uname = ""
+        tar_info.gname = ""
+
+        return tar_info
 
 class Downloader(metaclass=ABCMeta):
     """
@@ -71,16 +134,34 @@ class Downloader(metaclass=ABCMeta):
 class DefaultDownloader(Downloader):
     """
     The default implementation of the `Downloader` interface.
+
+    All `DefaultDownloader` objects share a single `requests.Session`, so downloads from the same
+    host reuse one pooled connection instead of paying the TCP and TLS handshake cost per file.
+    The session is created under a lock as download stages may run on multiple threads.
     """
 
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+
+    @staticmethod
+    def _get_session() -> requests.Session:
+        with DefaultDownloader._session_lock:
+            if DefaultDownloader._session is None:
+                DefaultDownloader._session = requests.Session()
+
+            return DefaultDownloader._session
+
     def download(self, url: str, dest_path: Path) -> None:
-        with urllib.request.urlopen(url) as response, dest_path.open(mode="wb") as outfile:
-            chunk_length = 250
-            chunk = response.read(chunk_length)
+        session = DefaultDownloader._get_session()
 
-            while len(chunk) > 0:
-                outfile.write(chunk)
-                chunk = response.read(chunk_length)
+        with session.get(url, stream=True) as response:
+            response.raise_for_status()
+
+            response.raw.decode_content = True
+
+            with dest_path.open(mode="wb") as outfile:
+                chunk_length = 1024 * 1024
+                shutil.copyfileobj(response.raw, outfile, length=chunk_length)
 
 class DownloadFileStage(EntryStage):
     """
@@ -151,6 +232,10 @@ class BuildDockerImageStage(FinalStage):
         self._build_args = build_args
         self._generated_dir_name = dbd.defaults.DOCKER_CONTEXT_GENERATED_DIR_NAME
 
+        # Caches the result of the docker image lookup - the postcondition is
+        # queried multiple times per build and each query is a docker API call.
+        self._image_exists: Optional[bool] = None
+
     def name(self) -> str:
         return self._name
 
@@ -159,28 +244,43 @@ class BuildDockerImageStage(FinalStage):
 
         buildargs = self.get_build_args()
 
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_context = Path(tmp)
+        # The build context is assembled as a tar archive and streamed to the docker daemon
+        # directly - copying the context resources and the (potentially large) generated
+        # archive to a temporary directory first would double the disk traffic.
+        with tempfile.SpooledTemporaryFile(max_size=_BUILD_CONTEXT_SPOOL_MAX_SIZE) as context_file:
+            with tarfile.open(fileobj=context_file, mode="w", bufsize=_TARFILE_BUFSIZE) as tar:
+                for item in self._build_context.iterdir():
+                    tar.add(str(item), arcname=item.name)
 
-            BuildDockerImageStage._copy_all(self._build_context.iterdir(), tmp_context)
+                generated_arcname = "{}/{}".format(self._generated_dir_name, input_path.name)
+                tar.add(str(input_path), arcname=generated_arcname)
 
-            generated_dir_path = tmp_context / self._generated_dir_name
-            generated_dir_path.mkdir()
-            BuildDockerImageStage._copy_tree_or_file(input_path, generated_dir_path)
+            context_file.seek(0)
 
-            self._docker_client.images.build(path=str(tmp_context),
+            self._docker_client.images.build(fileobj=context_file,
+                                             custom_context=True,
                                              buildargs=buildargs,
                                              tag=self._image_name,
                                              rm=True)
 
+        self._image_exists = None
+
     def postcondition_satisfied(self) -> bool:
         """
         Returns whether there exists a local docker image with the name given in the constructor.
 
+        The result is cached; the cache is invalidated when the `execute` method builds the image.
+
         Returns:
             `True` if the docker image with the given name exists; `False` otherwise.
         """
 
+        if self._image_exists is None:
+            self._image_exists = self._query_image_exists()
+
+        return self._image_exists
+
+    def _query_image_exists(self) -> bool:
         try:
             self._docker_client.images.get(self._image_name)
         except docker.errors.ImageNotFound:
@@ -204,15 +304,3 @@ class BuildDockerImageStage(FinalStage):
         buildargs["GENERATED_DIR"] = self._generated_dir_name
 
         return buildargs
-
-    @staticmethod
-    def _copy_all(items: Iterable[Path], dst: Path) -> None:
-        for item in items:
-            BuildDockerImageStage._copy_tree_or_file(item, dst)
-
-    @staticmethod
-    def _copy_tree_or_file(item: Path, dst: Path) -> None:
-        if item.is_dir():
-            shutil.copytree(item, dst / item.name)
-        else:
-            shutil.copy(item, dst)
@@ -8,9 +8,37 @@ import errno
 import logging
 import subprocess
 import sys
+import threading
 import time
 
-from typing import List
+from typing import List, Optional
+
+import docker
+
+_docker_client: Optional[docker.DockerClient] = None
+_docker_client_lock = threading.Lock()
+
+def get_docker_client() -> docker.DockerClient:
+    """
+    Returns a `docker.DockerClient` object that is shared by the whole application.
+
+    Creating a client with `docker.from_env` opens a new connection to the docker daemon and
+    pings it, so the client is created lazily on the first call and reused afterwards. The
+    initialisation is guarded by a lock as component builds run on multiple threads.
+
+    Returns:
+        The shared `docker.DockerClient` object.
+
+    """
+
+    # pylint: disable=global-statement
+    global _docker_client
+
+    with _docker_client_lock:
+        if _docker_client is None:
+            _docker_client = docker.from_env()
+
+        return _docker_client
 
 def _is_command_available(command: str) -> bool:
     try:
@@ -18,12 +18,11 @@ import tarfile
 import tempfile
 from typing import Any, Dict, List
 
-import docker
-
 from dbd.configuration import Configuration
 from dbd.component_builder import ComponentImageBuilder
 from dbd.component_config import DistInfo, DistType
 import dbd.defaults
+import dbd.docker_setup
 from dbd.default_component_image_builder.assembly import Assembly
 from dbd.default_component_image_builder.builder import DefaultComponentImageBuilder
 from dbd.default_component_image_builder.cache import Cache
@@ -183,7 +182,7 @@ class OoziePipelineBuilder(PipelineBuilder):
                                                                   dbd.defaults.HBASE_COMMON_JAR_VERSION)
             build_args = {"HBASE_COMMON_JAR_VERSION": hbase_common_jar_version}
 
-            pipeline.final_stage = DefaultPipelineBuilder.get_docker_image_stage(docker.from_env(),
+            pipeline.final_stage = DefaultPipelineBuilder.get_docker_image_stage(dbd.docker_setup.get_docker_client(),
                                                                                  image_name,
                                                                                  dependencies,
                                                                                  docker_context_dir,
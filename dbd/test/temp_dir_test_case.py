@@ -12,11 +12,22 @@ import unittest
 class TmpDirTestCase(unittest.TestCase):
     """
     A base class for test that use a temporary directory.
+
+    One temporary directory is created per test class and each test gets a fresh subdirectory
+    inside it - creating a plain subdirectory is much cheaper than setting up and cleaning up
+    a separate temporary directory for every test.
     """
 
-    def setUp(self) -> None:
-        self._tmp_dir = tempfile.TemporaryDirectory()
-        self._tmp_dir_path = Path(self._tmp_dir.name)
+    _class_tmp_dir: tempfile.TemporaryDirectory
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._class_tmp_dir = tempfile.TemporaryDirectory()
 
-    def tearDown(self) -> None:
-        self._tmp_dir.cleanup()
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._class_tmp_dir.cleanup()
+
+    def setUp(self) -> None:
+        self._tmp_dir_path = Path(self._class_tmp_dir.name) / self._testMethodName
+        self._tmp_dir_path.mkdir()
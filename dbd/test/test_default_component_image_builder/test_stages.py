@@ -5,6 +5,8 @@
 from typing import cast, Any, Callable, Dict, List, Optional
 from pathlib import Path
 
+import tarfile
+
 import docker
 
 from dbd.default_component_image_builder.stages import (BuildDockerImageStage,
@@ -28,6 +30,24 @@ class TestCreateTarfileStage(TmpDirTestCase):
 
         self.assertTrue(dest_path.exists())
 
+    def test_execute_normalises_the_owner_of_the_archive_members(self) -> None:
+        source_dir = self._tmp_dir_path / "source"
+        source_dir.mkdir()
+        (source_dir / "file.txt").touch()
+
+        dest_path = self._tmp_dir_path / "file.tar.gz"
+
+        stage = CreateTarfileStage("archive", source_dir)
+
+        stage.execute(dest_path)
+
+        with tarfile.open(dest_path) as tar:
+            for member in tar.getmembers():
+                self.assertEqual(0, member.uid)
+                self.assertEqual(0, member.gid)
+                self.assertEqual("", member.uname)
+                self.assertEqual("", member.gname)
+
 class TestDownloadFileStage(TmpDirTestCase):
     class MockDownloader(Downloader):
         def __init__(self) -> None:
@@ -70,17 +90,17 @@ class MockDockerClient:
     class Images:
         def __init__(self) -> None:
             self.called_args: Dict[Any, Any] = {}
-            self.files_in_context: List[Path] = []
+            self.context_members: List[str] = []
             self._images: List[str] = []
 
         def build(self, **kwargs: Dict[Any, Any]) -> None:
             self.called_args = kwargs
 
-            if not isinstance(self.called_args["path"], str):
-                raise ValueError("The path should be a string.")
+            if not self.called_args.get("custom_context"):
+                raise ValueError("A custom context tarball should be provided.")
 
-            path = Path(self.called_args["path"])
-            self.files_in_context = list(path.glob("**/*"))
+            with tarfile.open(fileobj=self.called_args["fileobj"]) as tar: # type: ignore
+                self.context_members = tar.getnames()
 
         def get(self, image_name: str) -> None:
             if image_name not in self._images:
@@ -136,11 +156,10 @@ class TestBuildDockerImageStage(TmpDirTestCase):
         expected_buildargs.update(build_args)
         self.assertEqual(expected_buildargs, called_args["buildargs"])
 
-        build_directory = Path(called_args["path"])
-        files_in_build_directory: List[Path] = docker_client.images.files_in_context
+        context_members: List[str] = docker_client.images.context_members
 
-        present_in_build_directory: Callable[[Path], bool] = lambda p: (build_directory / p) in files_in_build_directory
+        present_in_build_context: Callable[[Path], bool] = lambda p: str(p) in context_members
 
-        self.assertTrue(all(map(present_in_build_directory, files_in_build_context_resources)))
+        self.assertTrue(all(map(present_in_build_context, files_in_build_context_resources)))
 
-        self.assertTrue((build_directory / "generated" / input_file.name) in files_in_build_directory)
+        self.assertTrue("generated/{}".format(input_file.name) in context_members)
@@ -13,7 +13,7 @@ setup(
         ]
     },
 
-    install_requires = ['docker', 'pyyaml'],
+    install_requires = ['docker', 'pyyaml', 'requests'],
 
     # metadata to display on PyPI
     author="Daniel Becker",